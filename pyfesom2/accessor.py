@@ -66,12 +66,17 @@ usage pattern to `dataset.pyfesom2.method()` for methods applicable to to entire
 `dataset.pyfesom2.variable.method()` for methods on data-arrays.
 
 """
+import functools
 import warnings
-from typing import Optional, Sequence, Union, MutableMapping, Tuple
+import weakref
+from typing import Hashable, Optional, Sequence, Union, MutableMapping, Tuple
 
 import cartopy.crs as ccrs
 import numpy as np
+import pandas as pd
 import xarray as xr
+from numba import njit, prange
+from pyproj import Geod
 from shapely.geometry import MultiPolygon, Polygon, LineString
 
 # New Types
@@ -81,12 +86,48 @@ MultiRegion = Union[Sequence[Polygon], MultiPolygon]
 ArrayLike = Union[Sequence[float], np.ndarray, xr.DataArray]
 Path = Union[LineString, Tuple[ArrayLike, ArrayLike]]
 
+# KDTrees on mesh nodes, with geocentric coordinates they are built on, keyed by longitude and latitude arrays they
+# are built from. Xarray re-creates accessors (and wrapped objects) often, keeping trees here avoids rebuilding them,
+# an entry is dropped when its arrays are collected.
+_TREE_CACHE: MutableMapping[Hashable, Tuple[object, np.ndarray]] = {}
+
+_WGS84_GEOD = Geod(ellps='WGS84')
+
+# equatorial radius and flattening of WGS84 ellipsoid
+_WGS84_A = 6378137.0
+_WGS84_F = 1 / 298.257223563
+
+# radius of sphere used for geocentric coordinates of mesh nodes
+_ECEF_RADIUS = _WGS84_A
+
+# mean earth radius, radius of sphere used for haversine distances
+_MEAN_EARTH_RADIUS = 6371008.8
+
 
 # Selection
 
 # ---Utilities for selection
 
-def distance_along_trajectory(lons: ArrayLike, lats: ArrayLike) -> ArrayLike:
+def _cheap_ruler_cumdist(lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """Returns cumulative distances along last axis of lons, lats with equirectangular ("cheap ruler") approximation.
+
+    Each segment is scaled by lengths of a degree of longitude and latitude on WGS84 ellipsoid at its mid latitude,
+    which stays within 0.5% of geodesic distance for segments spanning a few degrees.
+    """
+    e2 = _WGS84_F * (2 - _WGS84_F)
+    deg_length = np.radians(_WGS84_A)
+    cos_lat = np.cos(np.radians(0.5 * (lats[..., 1:] + lats[..., :-1])))
+    w2 = 1 / (1 - e2 * (1 - cos_lat ** 2))
+    kx = deg_length * np.sqrt(w2) * cos_lat
+    ky = deg_length * np.sqrt(w2) * w2 * (1 - e2)
+    dlon = (np.diff(lons, axis=-1) + 180.) % 360. - 180.
+    dists = np.empty(lons.shape)
+    dists[..., 0] = 0.0
+    np.cumsum(np.hypot(dlon * kx, np.diff(lats, axis=-1) * ky), axis=-1, out=dists[..., 1:])
+    return dists
+
+
+def distance_along_trajectory(lons: ArrayLike, lats: ArrayLike, method: str = 'auto') -> ArrayLike:
     """Returns geodesic distance along a trajectory of lons and lons.
 
     Computes cumulative distance from starting lon, lat till end of array.
@@ -97,32 +138,57 @@ def distance_along_trajectory(lons: ArrayLike, lats: ArrayLike) -> ArrayLike:
         Array-like longitude values.
     lats
         Array-like latitude values.
+    method
+        "geodesic" for distances on WGS84 ellipsoid, "haversine" for faster great circle distances on a sphere or
+        "cheap_ruler" for equirectangular approximation, fastest but only accurate for short segments. "auto" uses
+        "cheap_ruler" when trajectory spans less than 5 degrees in latitude and each segment less than 5 degrees in
+        longitude, else "geodesic".
 
     Returns
     -------
     ArrayLike
         Returns array containing distances in meters
     """
-    from cartopy.geodesic import Geodesic
-    geod = Geodesic()
     lons, lats = np.array(lons, ndmin=1, copy=False), np.array(lats, ndmin=1, copy=False)
 
     if np.ndim(lons) > 2:
         raise NotImplementedError('More then 2 dims in lons are currenty not supported')
+    if method not in ('auto', 'geodesic', 'haversine', 'cheap_ruler'):
+        raise ValueError(f"Distance method can be one of 'auto', 'geodesic', 'haversine', 'cheap_ruler', "
+                         f"not {method}.")
 
-    dists = np.zeros(lons.shape)
+    # 1-D trajectory is treated as a single row, all rows are measured in one native call
+    rows_lons, rows_lats = np.atleast_2d(lons), np.atleast_2d(lats)
+    nrows, npts = rows_lons.shape
 
-    if np.ndim(lons) == 1:
-        points = np.c_[lons, lats]
-        temp_dist = geod.inverse(points[0:-1], points[1:])[:, 0]
-        dists[1:] = np.cumsum(temp_dist)
-    else:
-        for i, (_lons, _lats) in enumerate(zip(lons, lats)):
-            points = np.c_[_lons, _lats]
-            temp_dist = geod.inverse(points[0:-1], points[1:])[:, 0]
-            dists[i, 1:] = np.cumsum(temp_dist)
+    if nrows == 0 or npts < 2:
+        return np.zeros(lons.shape)
 
-    return dists
+    rows_lons, rows_lats = rows_lons.astype(np.float64, copy=False), rows_lats.astype(np.float64, copy=False)
+    if method == 'auto':
+        short_segments = (np.ptp(rows_lats) < 5.0
+                          and np.all(np.abs((np.diff(rows_lons, axis=-1) + 180.) % 360. - 180.) < 5.0))
+        method = 'cheap_ruler' if short_segments else 'geodesic'
+
+    if method == 'cheap_ruler':
+        return _cheap_ruler_cumdist(rows_lons, rows_lats).reshape(lons.shape)
+
+    # every distance is written below, zero filling would be wasted
+    dists = np.empty((nrows, npts))
+    if method == 'haversine':
+        # kernel is compiled for writable arrays only, read-only inputs like broadcast arrays are copied
+        rows_lons, rows_lats = np.require(rows_lons, requirements='W'), np.require(rows_lats, requirements='W')
+        _haversine_cumdist_nb(rows_lons, rows_lats, _MEAN_EARTH_RADIUS, dists)
+        return dists.reshape(lons.shape)
+
+    # rows are measured as one line, segments joining end of a row to start of next one are dropped
+    seg_lengths = np.empty(nrows * npts)
+    seg_lengths[:-1] = _WGS84_GEOD.line_lengths(np.ravel(rows_lons), np.ravel(rows_lats))
+    seg_lengths = seg_lengths.reshape(nrows, npts)[:, :-1]
+    dists[:, 0] = 0.0
+    np.cumsum(seg_lengths, axis=1, out=dists[:, 1:])
+
+    return dists.reshape(lons.shape)
 
 
 def normalize_distance(distance_array_in_m: ArrayLike) -> Tuple[str, ArrayLike]:
@@ -137,22 +203,250 @@ def normalize_distance(distance_array_in_m: ArrayLike) -> Tuple[str, ArrayLike]:
     tuple
         Returns tuple containing best units in m or km and transformed values.
     """
-    distance_array_in_km = distance_array_in_m / 1000.0
-    len_array = distance_array_in_m.shape[0]
-    # if more then 1/3 of points are best suited to be expressed in m else in km
-    if np.count_nonzero(distance_array_in_km < 1) > len_array // 3:
+    distance_array_in_m = np.asarray(distance_array_in_m)
+    # if more then 1/3 of points are best suited to be expressed in m else in km,
+    # conversion to km is only done when needed
+    if distance_array_in_m.size and np.mean(distance_array_in_m < 1000.0) > 1 / 3:
         return "m", distance_array_in_m
     else:
-        return "km", distance_array_in_km
+        return "km", distance_array_in_m / 1000.0
+
+
+# Kernels are compiled eagerly for their signatures, with cache=True compiled code is stored on disk and loaded on
+# later imports, so there is no JIT latency on first call in a session.
+@njit(["void(float64[:], float64[:], float64, float64[:, :])",
+       "void(float64[:], float64[:], float64, float32[:, :])"],
+      parallel=True, fastmath=True, cache=True)
+def _ecef_nb(lon, lat, R, out):
+    """Fills out[N, 3] with geocentric coordinates of 1-D float64 lon, lat in degrees."""
+    for i in prange(lon.size):
+        lon_rad = np.radians(lon[i])
+        lat_rad = np.radians(lat[i])
+        cos_lat = np.cos(lat_rad)
+        out[i, 0] = R * cos_lat * np.cos(lon_rad)
+        out[i, 1] = R * cos_lat * np.sin(lon_rad)
+        out[i, 2] = R * np.sin(lat_rad)
+
+
+@njit("void(float64[:, :], float64[:, :], float64, float64[:, :])", parallel=True, fastmath=True, cache=True)
+def _haversine_cumdist_nb(lons, lats, R, out):
+    """Fills out[nrows, npts] with cumulative haversine distances along rows of 2-D float64 lons, lats in degrees."""
+    for row in prange(lons.shape[0]):
+        out[row, 0] = 0.0
+        for i in range(1, lons.shape[1]):
+            lat0 = np.radians(lats[row, i - 1])
+            lat1 = np.radians(lats[row, i])
+            sin_dlat = np.sin(0.5 * (lat1 - lat0))
+            sin_dlon = np.sin(0.5 * np.radians(lons[row, i] - lons[row, i - 1]))
+            hav = sin_dlat * sin_dlat + np.cos(lat0) * np.cos(lat1) * sin_dlon * sin_dlon
+            out[row, i] = out[row, i - 1] + 2.0 * R * np.arcsin(np.sqrt(min(hav, 1.0)))
+
+
+def _lonlat_to_ecef(lon: ArrayLike, lat: ArrayLike, R: float = _ECEF_RADIUS, dtype: type = np.float64) -> np.ndarray:
+    """Returns geocentric (earth-centered, earth-fixed) coordinates of lon, lat on a sphere.
+
+    Last dimension of returned array, of size 3, holds x, y, z. Points are assumed to be at zero altitude, so the
+    transform is closed form and doesn't need a projection library.
+
+    Parameters
+    ----------
+    lon
+        Array-like longitudes in degrees.
+    lat
+        Array-like latitudes in degrees.
+    R
+        Radius of sphere in meters, by default equatorial radius of WGS84.
+    dtype
+        Data type of returned coordinates, float64 or float32, transform itself is always computed in float64.
+    """
+    lon, lat = np.array(lon, ndmin=1, dtype=np.float64), np.array(lat, ndmin=1, dtype=np.float64)
+    out = np.empty((lon.size, 3), dtype=dtype)
+    _ecef_nb(lon.ravel(), lat.ravel(), R, out)
+    return out.reshape(lon.shape + (3,))
+
 
+def _build_mesh_tree(lons: ArrayLike, lats: ArrayLike, balanced_tree: bool = True,
+                     compact_nodes: bool = True) -> Tuple[object, np.ndarray]:
+    """Returns a KDTree on geocentric coordinates of mesh nodes and those coordinates, of shape (N, 3).
 
-class SimpleMesh:
-    """Wrapper that fakes pyfesom's mesh object for purposes of this module"""
+    pykdtree's KDTree is used when available as it builds much faster, else Scipy's cKDTree. For cKDTree, balanced
+    and compact trees take longer to build but are shallower, which speeds up queries on dense meshes.
+
+    Coordinates are stored in float32, which halves memory traffic of building and querying the tree. At earth's
+    radius float32 resolves about 0.5 m, so nodes closer than a couple of meters may not be told apart; this is well
+    below resolution of FESOM meshes. Scipy's cKDTree converts points to float64 internally.
+    """
+    src_pts = _lonlat_to_ecef(lons, lats, dtype=np.float32)
+    try:
+        from pykdtree.kdtree import KDTree
+    except ImportError:
+        from scipy.spatial import cKDTree
+        return cKDTree(src_pts, leafsize=32, compact_nodes=compact_nodes, balanced_tree=balanced_tree), src_pts
+    return KDTree(src_pts, leafsize=32), src_pts
 
-    def __init__(self, lon: ArrayLike, lat: ArrayLike, faces: ArrayLike):
-        self.x2 = lon
-        self.y2 = lat
-        self.elem = faces
+
+def _query_nearest(tree: object, pts: np.ndarray) -> np.ndarray:
+    """Returns indices of tree's points nearest to pts, last dimension of pts holds coordinates.
+
+    Works for both pykdtree's KDTree and Scipy's cKDTree.
+    """
+    from scipy.spatial import cKDTree
+    query_pts = pts.reshape(-1, pts.shape[-1])
+    # repeated points, like revisited waypoints, are queried once, unless there are too few repeats to pay off
+    inverse = None
+    if len(query_pts) > 1:
+        uniq_pts, uniq_inverse = np.unique(query_pts, axis=0, return_inverse=True)
+        if len(uniq_pts) <= 0.9 * len(query_pts):
+            query_pts, inverse = uniq_pts, uniq_inverse.ravel()
+
+    if isinstance(tree, cKDTree):
+        # queries are spread over all cores
+        _, ind = tree.query(query_pts, k=1, workers=-1)
+    else:
+        # pykdtree parallelizes queries with OpenMP, but needs query points of same type as tree's points
+        _, ind = tree.query(np.ascontiguousarray(query_pts, dtype=tree.data_pts.dtype), k=1)
+    if inverse is not None:
+        ind = ind[inverse]
+    return ind.astype(np.intp).reshape(pts.shape[:-1])
+
+
+def _nearest_in_window(src_lons: np.ndarray, src_lats: np.ndarray, lon: np.ndarray, lat: np.ndarray,
+                       margin: float = 5.0, max_candidates: int = 4096, max_points: int = 256,
+                       src_pts: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """Returns indices of nodes nearest to lon, lat found by brute force among nodes in a window around them.
+
+    The window is padded such that nodes outside of it are more than margin degrees (great circle) away from all of
+    lon, lat, its longitude padding grows towards poles and wraps around the dateline. This way, for a few points, only
+    a small subset of a large mesh is searched and no tree needs to be built. None is returned without scanning the
+    mesh for more than max_points points, when window contains no or more than max_candidates nodes, or when a point
+    has no candidate within margin, as then the nearest node could be outside the window.
+
+    Parameters
+    ----------
+    src_lons, src_lats
+        Longitudes and latitudes of mesh nodes.
+    lon, lat
+        Array-like longitudes and latitudes of query points.
+    margin
+        Padding of window in degrees.
+    max_candidates
+        Largest number of nodes in window for which brute force search is used.
+    max_points
+        Largest number of points for which brute force search is used, longer paths are left to the tree.
+    src_pts
+        Geocentric coordinates of mesh nodes, as stored with the tree, to avoid transforming candidates.
+    """
+    lon, lat = np.array(lon, ndmin=1, dtype=np.float64), np.array(lat, ndmin=1, dtype=np.float64)
+    if lon.size > max_points:
+        return None
+    lat_min, lat_max = lat.min(), lat.max()
+    if not (np.isfinite(lat_min) and np.isfinite(lat_max) and np.all(np.isfinite(lon))):
+        return None
+
+    candidates = np.flatnonzero((src_lats >= lat_min - margin) & (src_lats <= lat_max + margin))
+    # nodes further than lon_pad in longitude from all points are further than margin in great circle distance
+    max_abs_lat = min(max(abs(lat_min), abs(lat_max)) + margin, 90.0)
+    sin_ratio = np.sin(np.radians(margin) / 2) / np.cos(np.radians(max_abs_lat))
+    if sin_ratio < 1:
+        lon_pad = np.degrees(2 * np.arcsin(sin_ratio))
+        lon_min, lon_max = lon.min(), lon.max()
+        center, half_width = 0.5 * (lon_min + lon_max), 0.5 * (lon_max - lon_min)
+        lon_offset = np.abs((src_lons[candidates] - center + 180.) % 360. - 180.)
+        candidates = candidates[lon_offset - half_width <= lon_pad]
+
+    if candidates.size == 0 or candidates.size > max_candidates or candidates.size * lon.size > 2 ** 20:
+        return None
+
+    # nearest by chord distance, which orders nodes same as great circle distance
+    if src_pts is None:
+        cand_pts = _lonlat_to_ecef(src_lons[candidates], src_lats[candidates])
+    else:
+        cand_pts = src_pts[candidates].astype(np.float64)
+    query_pts = _lonlat_to_ecef(lon.ravel(), lat.ravel())
+    sq_dists = ((query_pts[:, np.newaxis, :] - cand_pts[np.newaxis, :, :]) ** 2).sum(axis=-1)
+    nearest = np.argmin(sq_dists, axis=1)
+    max_sq_chord = (2 * _ECEF_RADIUS * np.sin(np.radians(margin) / 2)) ** 2
+    if np.any(sq_dists[np.arange(lon.size), nearest] > max_sq_chord):
+        return None
+    return candidates[nearest].reshape(lon.shape)
+
+
+def _array_owner(arr: np.ndarray) -> np.ndarray:
+    """Returns array owning memory of arr, views of same coordinates share it."""
+    return arr.base if isinstance(arr.base, np.ndarray) else arr
+
+
+def _mesh_key(lons: np.ndarray, lats: np.ndarray) -> Hashable:
+    """Returns key to the tree cache for nodes at lons, lats.
+
+    Key is made of identities of arrays owning lons and lats together with address, shape and strides of their data,
+    so that views on different subsets of same coordinates, like sliced datasets, get different keys.
+    """
+    return tuple((id(_array_owner(arr)), arr.__array_interface__['data'][0], arr.shape, arr.strides, arr.dtype.str)
+                 for arr in (lons, lats))
+
+
+def _cached_tree(xr_obj: Union[xr.Dataset, xr.DataArray], mesh_key: Optional[Hashable] = None,
+                 balanced_tree: bool = True, compact_nodes: bool = True,
+                 build: bool = True) -> Tuple[Optional[object], Optional[np.ndarray]]:
+    """Returns KDTree on nodes of xr_obj and geocentric coordinates of nodes it is built on from tree cache.
+
+    Tree and coordinates are built and cached if not already present, unless build is False, then None, None is
+    returned for them.
+
+    Parameters
+    ----------
+    xr_obj
+        xr.Dataset or DataArray with lon, lat coordinates.
+    mesh_key
+        Key to the tree cache, by default made from arrays holding longitudes and latitudes of xr_obj.
+    balanced_tree
+        Build tree splitting at median instead of midpoint, used only when tree is built.
+    compact_nodes
+        Shrink hyperrectangles of tree nodes to data range, used only when tree is built.
+    build
+        Build tree if it is not cached.
+    """
+    lon_values, lat_values = xr_obj.lon.values, xr_obj.lat.values
+    key = _mesh_key(lon_values, lat_values) if mesh_key is None else mesh_key
+
+    cached = _TREE_CACHE.get(key)
+    if cached is None:
+        if not build:
+            return None, None
+        cached = _build_mesh_tree(lon_values, lat_values, balanced_tree=balanced_tree, compact_nodes=compact_nodes)
+        _TREE_CACHE[key] = cached
+        # entry is dropped as soon as either of coordinates is collected
+        for owner in (_array_owner(lon_values), _array_owner(lat_values)):
+            weakref.finalize(owner, _TREE_CACHE.pop, key, None)
+    return cached
+
+
+@functools.lru_cache(maxsize=32)
+def _prepare_region(region_wkb: bytes, eps: float) -> object:
+    """Returns region buffered by eps and prepared for containment tests, cached on WKB of the region.
+
+    Buffering and preparing traverses all vertices of region, caching avoids that on repeated selections.
+    """
+    import shapely
+    import shapely.wkb
+    region = shapely.wkb.loads(region_wkb).buffer(eps)
+    if hasattr(shapely, 'prepare'):
+        # Shapely >= 2.0, prepares in place
+        shapely.prepare(region)
+        return region
+    from shapely.prepared import prep
+    return prep(region)
+
+
+def _remap_faces(cut_faces: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns unique node indices of cut_faces and faces re-indexed to positions of those nodes.
+
+    Hash based factorize is used as it avoids sorting all vertices of cut faces.
+    """
+    cut_faces = np.ascontiguousarray(cut_faces, dtype=np.int64)
+    inv_index, uniq = pd.factorize(cut_faces.ravel(), sort=True)
+    return uniq, inv_index.reshape(cut_faces.shape)
 
 
 # ---Selection functions
@@ -183,7 +477,6 @@ def select_bbox(xr_obj: Union[xr.DataArray, xr.Dataset],
     -------
 
     """
-    from .ut import cut_region
     faces = getattr(xr_obj, "faces", faces)
     if faces is None:
         raise ValueError(f"When passing a dataset it needs have faces in coords, or "
@@ -191,13 +484,14 @@ def select_bbox(xr_obj: Union[xr.DataArray, xr.Dataset],
                          f"When passing a data array, argument faces can't be None,"
                          f"faces must be indices[nelem,3] that define triangles.")
 
-    mesh = SimpleMesh(xr_obj.lon, xr_obj.lat, faces)
-    bbox = np.asarray(bbox)
-    # cut region takes xmin, xmax, ymin, ymax
-    cut_faces, _ = cut_region(mesh, [bbox[0], bbox[2], bbox[1], bbox[3]])
-    cut_faces = np.asarray(cut_faces)
-    uniq, inv_index = np.unique(cut_faces.ravel(), return_inverse=True)
-    new_faces = inv_index.reshape(cut_faces.shape)
+    faces = np.asarray(faces)
+    lon, lat = np.ascontiguousarray(xr_obj.lon.values), np.ascontiguousarray(xr_obj.lat.values)
+    xmin, ymin, xmax, ymax = np.asarray(bbox)
+    # closed bounds like pyfesom2.ut's cut_region, faces are selected only when all their nodes are in bbox
+    selection = (lon >= xmin) & (lon <= xmax) & (lat >= ymin) & (lat <= ymax)
+    face_mask = selection[faces[:, 0]] & selection[faces[:, 1]] & selection[faces[:, 2]]
+    cut_faces = faces[face_mask]
+    uniq, new_faces = _remap_faces(cut_faces)
     ret = xr_obj.isel(nod2=uniq)
     if isinstance(xr_obj, xr.DataArray):
         ret = ret.to_dataset()
@@ -209,7 +503,7 @@ def select_region(xr_obj: Union[xr.DataArray, xr.Dataset], region: Region,
                   faces: Optional[ArrayLike] = None) -> xr.Dataset:
     """Returns a FESOM data subset for specified arbitrary region.
 
-    This method uses vectorized Shapely's vectorized routines to find nodes contained by specified polygon. Faces
+    This method uses Shapely's vectorized routines to find nodes contained by specified polygon. Faces
     (or triangles) have all the selected nodes are re-indexed to indices of selected nodes. To retain this triangulation
     information a Dataset is returned.
 
@@ -227,9 +521,8 @@ def select_region(xr_obj: Union[xr.DataArray, xr.Dataset], region: Region,
     -------
     xr.DataSet
     """
+    import shapely
     from shapely.geometry import box, Polygon
-    from shapely.prepared import prep
-    from shapely.vectorized import contains as vectorized_contains
 
     if isinstance(region, Sequence) and len(region) == 4:
         region = box(*region)
@@ -246,23 +539,27 @@ def select_region(xr_obj: Union[xr.DataArray, xr.Dataset], region: Region,
                          f"When passing a data array, argument faces can't be None,"
                          f"faces must be indices[nelem,3] that define triangles.")
     faces = np.asarray(faces)
+    lon_arr = np.ascontiguousarray(xr_obj.lon.values)
+    lat_arr = np.ascontiguousarray(xr_obj.lat.values)
 
     # buffer is necessry to facilitte floating point comparisions
     # buffer can be thought as tolerance around region in degrees
     # its value should be at least precision of data type of lats, lons (np.finfo)
-    region = region.buffer(1e-6)
-    prep_region = prep(region)
-    selection = vectorized_contains(prep_region, np.asarray(xr_obj.lon), np.asarray(xr_obj.lat))
+    prep_region = _prepare_region(region.wkb, 1e-6)
+    if hasattr(shapely, 'contains_xy'):
+        # Shapely >= 2.0, shapely.vectorized is much slower there
+        selection = shapely.contains_xy(prep_region, lon_arr, lat_arr)
+    else:
+        from shapely.vectorized import contains as vectorized_contains
+        selection = vectorized_contains(prep_region, lon_arr, lat_arr)
     if np.count_nonzero(selection) == 0:
         warnings.warn('No points in domain are within region, returning original data.')
         return xr_obj
 
-    selection = selection[faces]
-    face_mask = np.all(selection, axis=1)
+    # faces entirely in region, without (nelem, 3) intermediate of selection[faces]
+    face_mask = selection[faces[:, 0]] & selection[faces[:, 1]] & selection[faces[:, 2]]
     cut_faces = faces[face_mask]
-    cut_faces = np.array(cut_faces, ndmin=1)
-    uniq, inv_index = np.unique(cut_faces.ravel(), return_inverse=True)
-    new_faces = inv_index.reshape(cut_faces.shape)
+    uniq, new_faces = _remap_faces(cut_faces)
     ret = xr_obj.isel(nod2=uniq)
 
     if 'faces' in ret.coords:
@@ -283,7 +580,9 @@ def select_region(xr_obj: Union[xr.DataArray, xr.Dataset], region: Region,
 def select_points(xr_obj: Union[xr.Dataset, xr.DataArray],
                   lon: ArrayLike, lat: ArrayLike, method: str = 'nearest', tolerance: Optional[float] = None,
                   tree: Optional[object] = None, return_distance: Optional[bool] = True,
-                  selection_dim_name: Optional[str] = "nod2", **other_dims) -> Union[xr.Dataset, xr.DataArray]:
+                  selection_dim_name: Optional[str] = "nod2", mesh_key: Optional[Hashable] = None,
+                  candidate_search: bool = True, src_pts: Optional[np.ndarray] = None,
+                  **other_dims) -> Union[xr.Dataset, xr.DataArray]:
     """Returns a FESOM point dataset for specified longitudes and latitudes and other dimension representing
      a trajectory.
 
@@ -312,12 +611,21 @@ def select_points(xr_obj: Union[xr.Dataset, xr.DataArray],
     tolerance
         A tolerance radius to select non missing values, currently not supported.
     tree
-        A Scipy cKDtree object, this speeds up repeated queries on input data.
+        A pykdtree KDTree or Scipy cKDtree object, this speeds up repeated queries on input data. When not passed, a
+        cached tree is used, it is built only when points can't be found by candidate search.
     return_distance
         If True returns distance along selection lon, lat in metric units as a coordinate of returned dataset.
     selection_dim_name
         When points are defined on more then lon and lat, this argument defines the name of stacked dimension. By
         default data is stacked on dimension nod2.
+    mesh_key
+        Key to look up a cached tree when tree is not passed, by default made from longitudes and latitudes of xr_obj.
+    candidate_search
+        If True and no tree is passed or cached, nearest nodes to a few points are first searched by brute force among
+        nodes around them, which avoids building the tree on large meshes. Tree is built when this search is not
+        conclusive.
+    src_pts
+        Geocentric coordinates of nodes of xr_obj as stored with tree, reused by candidate search when given.
     other_dims
         Additional arguments that define multi-dimensional transects. For example: time=..., nz1=... These arguments
         have to be dimensions of dataarray or dataset.
@@ -327,43 +635,60 @@ def select_points(xr_obj: Union[xr.Dataset, xr.DataArray],
     xr.Dataset or xr.DataArray
         Returns data type similar to input data.
     """
-    from cartopy.crs import Geocentric, Geodetic
-    from scipy.spatial import cKDTree
-    src_lons, src_lats = np.asarray(xr_obj.lon), np.asarray(xr_obj.lat)
-
-    set_len_dims = {np.size(lon), np.size(lat), *[np.size(val) for val in other_dims.values()]}
+    lon_arr, lat_arr = np.asarray(lon), np.asarray(lat)
+    set_len_dims = {lon_arr.size, lat_arr.size, *[np.size(val) for val in other_dims.values()]}
 
     if len(set_len_dims) > 1:
         raise ValueError('For point selection length of all supplied dims args should be same.')
 
     if not method == 'nearest':
         raise NotImplementedError("Spatial selection currently supports only nearest neighbor lookup")
-    geocentric_crs, geodetic_crs = Geocentric(), Geodetic()
-    if tree is None:
-        src_pts = geocentric_crs.transform_points(geodetic_crs, src_lons, src_lats)
-        tree = cKDTree(src_pts, leafsize=32, compact_nodes=False, balanced_tree=False)
 
     if isinstance(lon, xr.DataArray) and isinstance(lat, xr.DataArray):
         sel_dim = tuple(lon.dims)
     else:
         sel_dim = selection_dim_name
 
-    dst_pts = geocentric_crs.transform_points(geodetic_crs, np.asarray(lon), np.asarray(lat))
-
-    if tolerance is None:
-        _, ind = tree.query(dst_pts)
-    else:
+    if tolerance is not None:
         raise NotImplementedError('tolerance is currently not supported.')
 
+    if tree is None:
+        # only a tree that is already built is looked up here, candidate search may make it unnecessary
+        tree, cached_src_pts = _cached_tree(xr_obj, mesh_key=mesh_key, build=False)
+        src_pts = cached_src_pts if src_pts is None else src_pts
+
+    if src_pts is not None and src_pts.shape[0] != xr_obj.sizes['nod2']:
+        raise ValueError(f"src_pts has coordinates of {src_pts.shape[0]} nodes, but data has "
+                         f"{xr_obj.sizes['nod2']} nodes.")
+
+    ind = None
+    # querying a tree that exists is cheaper than scanning the mesh for candidates
+    if candidate_search and tree is None:
+        ind = _nearest_in_window(np.asarray(xr_obj.lon.values), np.asarray(xr_obj.lat.values), lon_arr, lat_arr,
+                                 src_pts=src_pts)
+    if ind is None:
+        if tree is None:
+            tree, _ = _cached_tree(xr_obj, mesh_key=mesh_key)
+        dst_pts = _lonlat_to_ecef(lon_arr, lat_arr, dtype=np.float32)  # same precision as points of tree
+        ind = _query_nearest(tree, dst_pts)
+
+    if isinstance(sel_dim, tuple) or (sel_dim != 'nod2' and 'nod2' in xr_obj.coords):
+        # renaming would also rename nod2 coordinate, indexer keeps it as a coordinate along sel_dim
+        ret_obj = xr_obj.isel(nod2=xr.DataArray(ind, dims=sel_dim))
+    else:
+        # plain indices are cheaper for xarray than wrapping them in a DataArray
+        ret_obj = xr_obj.isel(nod2=ind)
+        if sel_dim != 'nod2':
+            ret_obj = ret_obj.rename({'nod2': sel_dim})
     other_dims = {k: xr.DataArray(np.array(v, ndmin=1), dims=sel_dim) for k, v in other_dims.items()}
-    ret_obj = xr_obj.isel(nod2=xr.DataArray(ind, dims=sel_dim)).sel(**other_dims, method=method)
+    ret_obj = ret_obj.sel(**other_dims, method=method)
 
     # from faces, which will not be useful in returned dataset
     # unless we reindex them, but is there a use case for that?
     if 'faces' in ret_obj.coords:
         ret_obj = ret_obj.drop_vars('faces')
     if return_distance:
-        dist = distance_along_trajectory(lon, lat)
+        dist = distance_along_trajectory(lon_arr, lat_arr)
         dist_units, dist = normalize_distance(dist)
         ret_obj = ret_obj.assign_coords({'distance': (sel_dim, dist)})
         ret_obj.distance.attrs['units'] = dist_units
@@ -374,7 +699,7 @@ def select_points(xr_obj: Union[xr.Dataset, xr.DataArray],
 def select(xr_obj: xr.Dataset, method: str = 'nearest',
            tolerance: float = None, region: Optional[Region] = None,
            path: Optional[Union[Path, MutableMapping]] = None, tree: Optional[object] = None,
-           **indexers) -> Union[xr.Dataset, xr.DataArray]:
+           src_pts: Optional[np.ndarray] = None, **indexers) -> Union[xr.Dataset, xr.DataArray]:
     """A generalized interface to select data from unstructured FESOM dataset.
 
     This method provides interface to similar to sel method of Xarray for an unstructured FESOM data. In addition there
@@ -395,7 +720,9 @@ def select(xr_obj: xr.Dataset, method: str = 'nearest',
     path
         A tuple of same-sized longitudes, latitudes or Shapely's LineString or a dictionary with keys as dimensions.
     tree
-        A Scipy cKDtree object, this speeds up repeated queries on input data.
+        A pykdtree KDTree or Scipy cKDtree object, this speeds up repeated queries on input data.
+    src_pts
+        Geocentric coordinates of nodes of xr_obj as stored with tree, reused by point selection when given.
     indexers
         Additional arguments that define multi-dimensional transects. For example: time=..., nz1=... These arguments
         have to be dimensions of the dataset. These indexers are passed to xarray's sel method as-is.
@@ -419,7 +746,7 @@ def select(xr_obj: xr.Dataset, method: str = 'nearest',
         if lat_indexer and lon_indexer:
             if method == 'nearest':
                 ret_arr = select_points(xr_obj, lon, lat, method=method, tolerance=tolerance, tree=tree,
-                                        return_distance=False)
+                                        return_distance=False, src_pts=src_pts)
             else:
                 raise NotImplementedError("Only method='nearest' is currently supported.")
         else:
@@ -438,9 +765,10 @@ def select(xr_obj: xr.Dataset, method: str = 'nearest',
                 raise ValueError('Path of more then 2 columns (lons, lats) is ambiguous, use dictionary instead')
             else:
                 lon, lat = path
-                ret_arr = select_points(xr_obj, lon, lat, method=method, tolerance=tolerance, tree=tree)
+                ret_arr = select_points(xr_obj, lon, lat, method=method, tolerance=tolerance, tree=tree,
+                                        src_pts=src_pts)
         elif isinstance(path, dict):
-            ret_arr = select_points(xr_obj, method=method, tolerance=tolerance, tree=tree, **path)
+            ret_arr = select_points(xr_obj, method=method, tolerance=tolerance, tree=tree, src_pts=src_pts, **path)
         else:
             raise ValueError('Invalid path argument it can only be sequence of (lons, lats), shapely 2D LineString or'
                              'dictionary containing coords.')
@@ -471,6 +799,7 @@ class FESOMDataset:
         self._xrobj = xr_obj = xr_dataset
         # TODO: check valid fesom data? otherwise accessor is available on all xarray datasets
         self._tree_obj = None
+        self._src_pts_obj = None
         for datavar in xr_obj.data_vars.keys():
             setattr(self, str(datavar), FESOMDataArray(xr_obj[datavar], xr_obj))
 
@@ -540,17 +869,14 @@ class FESOMDataset:
         xr.Dataset
             Returned dataset contains distance along trajectory in metric units (m or km) as a coordinate.
         """
-        tree = self._tree
+        # tree is built by select_points only when needed, few points are found without it
+        tree, src_pts = self._tree_obj, self._src_pts_obj
         return select_points(self._xrobj, lon, lat, method=method, tolerance=tolerance, tree=tree, return_distance=True,
-                             **other_dims)
+                             src_pts=src_pts, **other_dims)
 
-    def _build_tree(self):
-        from cartopy.crs import Geocentric, Geodetic
-        from scipy.spatial import cKDTree
-        geocentric_crs, geodetic_crs = Geocentric(), Geodetic()
-        src_pts = geocentric_crs.transform_points(geodetic_crs, np.asarray(self._xrobj.lon),
-                                                  np.asarray(self._xrobj.lat))
-        self._tree_obj = cKDTree(src_pts, leafsize=32, compact_nodes=False, balanced_tree=False)
+    def _build_tree(self, balanced_tree: bool = True, compact_nodes: bool = True):
+        self._tree_obj, self._src_pts_obj = _cached_tree(self._xrobj, balanced_tree=balanced_tree,
+                                                         compact_nodes=compact_nodes)
         return self._tree_obj
 
     @property
@@ -560,6 +886,13 @@ class FESOMDataset:
             return self._tree_obj
         return self._build_tree()
 
+    @property
+    def _src_pts(self):
+        """Geocentric coordinates of nodes the tree is built on, built along with the tree"""
+        if self._src_pts_obj is None:
+            self._build_tree()
+        return self._src_pts_obj
+
     def __repr__(self):
         return self._xrobj.__repr__()
 
@@ -606,9 +939,10 @@ class FESOMDataArray:
         sel_obj = self._xrobj.to_dataset()
         sel_obj = sel_obj.assign_coords({'faces': (self._context_dataset.faces.dims,
                                                    self._context_dataset.faces.values)})
-        tree = self._context_dataset.pyfesom2._tree
+        context_accessor = self._context_dataset.pyfesom2
+        tree, src_pts = context_accessor._tree_obj, context_accessor._src_pts_obj
         sel_obj = select(sel_obj, method=method, tolerance=tolerance, region=region, path=path, tree=tree,
-                         **indexers)
+                         src_pts=src_pts, **indexers)
         return sel_obj
 
     def select_points(self, lon: Union[float, np.ndarray], lat: Union[float, np.ndarray], method: str = 'nearest',
@@ -648,9 +982,10 @@ class FESOMDataArray:
 
             Returned dataarray contains distance along trajectory in metric units (m or km) as a coordinate.
         """
-        tree = self._context_dataset.pyfesom2._tree
+        context_accessor = self._context_dataset.pyfesom2
+        tree, src_pts = context_accessor._tree_obj, context_accessor._src_pts_obj
         return select_points(self._xrobj, lon, lat, method=method, tolerance=tolerance, tree=tree, return_distance=True,
-                             **other_dims)
+                             src_pts=src_pts, **other_dims)
 
     def __repr__(self):
         return f"Wrapped {self._xrobj.__repr__()}\n{super().__repr__()}"
@@ -643,11 +643,11 @@ def cut_region(mesh, box):
         & (mesh.y2 <= up)
     )
 
-    elem_selection = selection[mesh.elem]
+    # elements with all three nodes in the box, without (elem, 3) intermediate of selection[mesh.elem]
+    elem = mesh.elem
+    no_nan_triangles = selection[elem[:, 0]] & selection[elem[:, 1]] & selection[elem[:, 2]]
 
-    no_nan_triangles = np.all(elem_selection, axis=1)
-
-    elem_no_nan = mesh.elem[no_nan_triangles]
+    elem_no_nan = elem[no_nan_triangles]
 
     return elem_no_nan, no_nan_triangles
 
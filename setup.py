@@ -23,6 +23,7 @@ requirements = [
     "numba",
     "numpy",
     "pandas",
+    "pyproj",
     "pyresample",
     "pytest",
     "scipy",
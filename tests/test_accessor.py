@@ -107,6 +107,55 @@ def test_normalize_distances():
     assert ~np.any(np.isnan(dist)), 'NaNs in dists should not be possible.'
 
 
+def test_distance_along_trajectory():
+    from pyfesom2.accessor import distance_along_trajectory
+
+    lons = np.array([[0., 1., 2., 3.], [10., 10., 10., 10.]])
+    lats = np.array([[0., 0., 0., 0.], [-10., 0., 10., 20.]])
+    dists = distance_along_trajectory(lons, lats)
+    assert dists.shape == lons.shape
+    assert np.all(dists[:, 0] == 0.0)
+    # rows are independent trajectories, same as computing them one by one
+    for row_lons, row_lats, row_dists in zip(lons, lats, dists):
+        assert np.allclose(distance_along_trajectory(row_lons, row_lats), row_dists)
+    assert np.isclose(dists[0, 1], 111319.49, rtol=1e-4)  # 1 deg along equator
+
+    assert np.array_equal(distance_along_trajectory(0., 0.), [0.])
+
+    # great circle distances on a sphere are within 1% of geodesic ones
+    hav_dists = distance_along_trajectory(lons, lats, method='haversine')
+    assert np.allclose(hav_dists, dists, rtol=1e-2)
+    # read-only inputs
+    ro_lons, ro_lats = np.broadcast_to(lons[0], lons.shape), np.broadcast_to(lats[0], lats.shape)
+    assert np.allclose(distance_along_trajectory(ro_lons, ro_lats, method='haversine'), hav_dists[[0, 0]])
+    with pytest.raises(ValueError):
+        distance_along_trajectory(lons, lats, method='rhumb')
+
+    # short section at high latitude, auto uses cheap ruler
+    lons = np.linspace(-20., -10., 50)
+    lats = np.linspace(70., 73., 50)
+    dists = distance_along_trajectory(lons, lats)
+    assert np.array_equal(dists, distance_along_trajectory(lons, lats, method='cheap_ruler'))
+    assert np.allclose(dists, distance_along_trajectory(lons, lats, method='geodesic'), rtol=5e-3)
+
+
+def test_lonlat_to_ecef():
+    from pyfesom2.accessor import _lonlat_to_ecef
+
+    pts = _lonlat_to_ecef([0., 90., 0.], [0., 0., 90.], R=1.)
+    assert np.allclose(pts, [[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]])
+    assert _lonlat_to_ecef(10., 20.).shape == (1, 3)
+
+
+def test_remap_faces():
+    from pyfesom2.accessor import _remap_faces
+
+    uniq, new_faces = _remap_faces(np.array([[7, 3, 9], [9, 3, 12]], dtype=np.int32))
+    assert np.array_equal(uniq, [3, 7, 9, 12])
+    assert np.array_equal(new_faces, [[1, 0, 2], [2, 0, 3]])
+    assert np.array_equal(uniq[new_faces], [[7, 3, 9], [9, 3, 12]])
+
+
 # Test selection methods
 
 bbox_tests = [
@@ -234,6 +283,80 @@ def test_select_points(dataset, npoints, request):
     assert len(sda.nod2) == npoints
 
 
+def test_select_points_candidate_search(random_spatial_dataset):
+    from pyfesom2.accessor import select_points, _build_mesh_tree, _nearest_in_window
+    # new coordinates, so that no tree is cached for them and candidate search is used
+    dataset = random_spatial_dataset.copy(deep=True)
+    # few points, including ones near poles and across dateline
+    lons = np.array([179.5, -179.5, 0., 45., -120.])
+    lats = np.array([10., 10., 89.5, -89.5, 30.])
+    tree, src_pts = _build_mesh_tree(dataset.lon.values, dataset.lat.values)
+    for lon, lat in zip(lons, lats):
+        sda = select_points(dataset, lon, lat, return_distance=False, src_pts=src_pts)
+        sda_tree = select_points(dataset, lon, lat, return_distance=False, tree=tree)
+        assert np.array_equal(sda.lon, sda_tree.lon) and np.array_equal(sda.lat, sda_tree.lat)
+        ind = _nearest_in_window(dataset.lon.values, dataset.lat.values, lon, lat)
+        if ind is not None:
+            ind_src_pts = _nearest_in_window(dataset.lon.values, dataset.lat.values, lon, lat, src_pts=src_pts)
+            assert np.array_equal(ind, ind_src_pts)
+            assert np.array_equal(dataset.lon.values[ind], sda_tree.lon)
+            assert np.array_equal(dataset.lat.values[ind], sda_tree.lat)
+    # coordinates of another mesh are not used
+    with pytest.raises(ValueError):
+        select_points(dataset.isel(nod2=slice(0, 100)), lons[0], lats[0], src_pts=src_pts)
+
+    # too many candidates or points, tree has to be used
+    assert _nearest_in_window(dataset.lon.values, dataset.lat.values, lons, lats, max_candidates=0) is None
+    assert _nearest_in_window(dataset.lon.values, dataset.lat.values, lons, lats, max_points=4) is None
+
+
+def test_select_points_without_tree(random_spatial_dataset):
+    from pyfesom2.accessor import _cached_tree
+    dataset = random_spatial_dataset.copy(deep=True)
+    # a node of mesh is its own nearest node within margin, accessors don't build a tree for it
+    lon, lat = dataset.lon.values[0], dataset.lat.values[0]
+    dataset.pyfesom2.select_points(lon, lat)
+    dataset.pyfesom2.dummy_2d_var.select_points(lon, lat)
+    assert dataset.pyfesom2._tree_obj is None
+    assert _cached_tree(dataset, build=False) == (None, None)
+
+
+def test_select_points_repeated(random_spatial_dataset):
+    from pyfesom2.accessor import select_points
+    dataset = random_spatial_dataset
+    # trajectory going back and forth, repeated points are queried once
+    lons = np.tile(np.linspace(-60., 60., 10), 4)
+    lats = np.tile(np.linspace(-40., 40., 10), 4)
+    sda = select_points(dataset, lons, lats, candidate_search=False)
+    sda_once = select_points(dataset, lons[:10], lats[:10], candidate_search=False)
+    assert np.array_equal(sda.lon.values, np.tile(sda_once.lon.values, 4))
+    assert np.array_equal(sda.lat.values, np.tile(sda_once.lat.values, 4))
+
+
+def test_query_nearest_unique_points():
+    from pyfesom2.accessor import _lonlat_to_ecef, _query_nearest
+
+    class RecordingTree:
+        """Stands in for pykdtree's KDTree, records sizes of queries"""
+        data_pts = np.empty((0, 3), dtype=np.float32)
+
+        def __init__(self):
+            self.query_sizes = []
+
+        def query(self, pts, k=1):
+            self.query_sizes.append(len(pts))
+            return np.zeros(len(pts)), np.arange(len(pts))
+
+    # trajectory going back and forth over 10 points
+    pts = _lonlat_to_ecef(np.tile(np.linspace(-60., 60., 10), 4), np.tile(np.linspace(-40., 40., 10), 4))
+    tree = RecordingTree()
+    ind = _query_nearest(tree, pts)
+    assert tree.query_sizes == [10]
+    assert ind.shape == (40,)
+    assert np.array_equal(ind, np.tile(ind[:10], 4))
+    assert len(np.unique(ind)) == 10
+
+
 @pytest.mark.parametrize("npoints", [10])
 def test_select_points_advanced(random_nd_dataset, npoints):
     """Test trajectory like selection on time, level dimensions"""
@@ -258,6 +381,56 @@ def test_select_points_advanced(random_nd_dataset, npoints):
     assert not all([dim in sda.dims for dim in ('time', 'nz1')])
 
 
+def test_select_points_dim_name(random_spatial_dataset):
+    import xarray as xr
+    from pyfesom2.accessor import select_points
+    ind = np.random.choice(len(random_spatial_dataset.nod2), 10)
+    lons, lats = random_spatial_dataset.lon.values[ind], random_spatial_dataset.lat.values[ind]
+    # same as indexing with a DataArray on new dimension, also when nod2 is a coordinate variable
+    nod2_coord = random_spatial_dataset.assign_coords(nod2=np.arange(len(random_spatial_dataset.nod2)))
+    for dataset in (random_spatial_dataset, nod2_coord):
+        expected = dataset.isel(nod2=xr.DataArray(ind, dims='points')).drop_vars('faces')
+        sda = select_points(dataset, lons, lats, return_distance=False, selection_dim_name='points')
+        xr.testing.assert_identical(sda, expected)
+        sda = select_points(dataset.dummy_2d_var, lons, lats, return_distance=False, selection_dim_name='points')
+        xr.testing.assert_identical(sda, expected.dummy_2d_var)
+
+
+def test_tree_cache(five_point_dataset):
+    import gc
+    from pyfesom2.accessor import _TREE_CACHE
+
+    dataset = five_point_dataset.copy(deep=True)
+    tree = dataset.pyfesom2._tree
+    # geocentric coordinates of nodes are kept along with tree
+    assert dataset.pyfesom2._src_pts.shape == (len(dataset.nod2), 3)
+    # tree survives re-wrapping of dataset and is shared with its data arrays
+    assert dataset.copy().pyfesom2._tree is tree
+    assert dataset.pyfesom2.dummy_2d_var._context_dataset.pyfesom2._tree is tree
+
+    n_cached = len(_TREE_CACHE)
+    del dataset, tree
+    gc.collect()
+    assert len(_TREE_CACHE) < n_cached
+
+
+def test_tree_cache_views(random_spatial_dataset):
+    from pyfesom2.accessor import _cached_tree, select_points
+    dataset = random_spatial_dataset.copy(deep=True)
+    tree, src_pts = _cached_tree(dataset)
+    # subsets are views on same coordinates, but are different meshes
+    for subset in (dataset.isel(nod2=slice(0, 100)), dataset.isel(nod2=slice(None, None, 2))):
+        sub_tree, sub_src_pts = _cached_tree(subset)
+        assert sub_tree is not tree
+        assert sub_src_pts.shape == (len(subset.nod2), 3)
+        lons, lats = subset.lon.values[-3:], subset.lat.values[-3:]
+        sda = select_points(subset, lons, lats, candidate_search=False, return_distance=False)
+        assert np.array_equal(sda.lon.values, lons) and np.array_equal(sda.lat.values, lats)
+    assert _cached_tree(dataset)[0] is tree
+    # changed latitudes are a different mesh too
+    assert _cached_tree(dataset.assign_coords(lat=('nod2', -dataset.lat.values)))[0] is not tree
+
+
 def test_selection_of_faces(five_point_dataset):
     from shapely.geometry import box
     from pyfesom2.accessor import select_region
@@ -272,6 +445,15 @@ def test_selection_of_faces(five_point_dataset):
     assert np.all(np.isin([-90., 90., 0.], sel_da.lat))
 
 
+def test_select_region_reuses_prepared_region(five_point_dataset):
+    from pyfesom2.accessor import select_region, _prepare_region
+    region = Polygon([(-70, 30), (-10, 0), (-10, 60)])
+    select_region(five_point_dataset, region)
+    hits = _prepare_region.cache_info().hits
+    select_region(five_point_dataset, Polygon(region.exterior.coords))  # equal region, different object
+    assert _prepare_region.cache_info().hits == hits + 1
+
+
 def test_select(random_nd_dataset):
     dataset = random_nd_dataset
     npoints = 20